@@ -1,4 +1,5 @@
 import bpy
+import numpy as np
 from bpy.props import *
 
 # In order to apply (UNIFORM) scale on an armature without breaking the rigging, 
@@ -9,6 +10,33 @@ from bpy.props import *
 # - Every driver expression that references a variable that is a location. NOTE: Not implemented.
 # - Every custom shape transform location offset value.
 
+# Constraint type : Names of the constraint's properties which store a location/distance/length value.
+LOCATION_PROPS = {
+	'LIMIT_LOCATION' : ['min_x', 'max_x', 'min_y', 'max_y', 'min_z', 'max_z'],
+	'LIMIT_SCALE' : ['min_x', 'max_x', 'min_y', 'max_y', 'min_z', 'max_z'],
+	'LIMIT_DISTANCE' : ['distance'],
+	'TRANSFORM' : [
+		"from_min_x", "from_max_x", "to_min_x", "to_max_x",
+		"from_min_y", "from_max_y", "to_min_y", "to_max_y",
+		"from_min_z", "from_max_z", "to_min_z", "to_max_z"
+	],
+	'STRETCH_TO' : ["rest_length"],
+	'ACTION' : ["min", "max"],
+	'FLOOR' : ["offset"],
+}
+
+def scale_fcurve_values(fcurve, scale):
+	"""Multiply the value of every keyframe and keyframe handle of an F-Curve.
+	Uses foreach_get/set rather than looping over keyframes in Python, since Actions can have a lot of them.
+	"""
+	keyframes = fcurve.keyframe_points
+	coords = np.empty(len(keyframes) * 2, dtype=np.float32)
+	for attr in ('co', 'handle_left', 'handle_right'):
+		keyframes.foreach_get(attr, coords)
+		coords[1::2] *= scale
+		keyframes.foreach_set(attr, coords)
+	fcurve.update()
+
 class ApplyArmatureScale(bpy.types.Operator):
 	""" Apply uniform scaling to an armature while adjusting constraints and used Actions so the armature behaves identically on the new scale. Does not adjust drivers that might affect or read locations, nor apply scale of child objects"""
 	bl_idname = "object.apply_armature_scale"
@@ -39,13 +67,14 @@ class ApplyArmatureScale(bpy.types.Operator):
 		o = context.object
 		if (o.scale[0] != o.scale[1]) or (o.scale[0] != o.scale[2]):
 			# Scale must be uniform!
-			return {['CANCELLED']}
+			return {'CANCELLED'}
 
+		# Only toggle modes when we have to, since each switch re-evaluates the rig.
 		org_mode = o.mode
-		bpy.ops.object.mode_set(mode='OBJECT')
+		if org_mode != 'OBJECT':
+			bpy.ops.object.mode_set(mode='OBJECT')
 
 		scale = o.scale[0]
-		props = []
 		actions = []
 
 		for b in o.pose.bones:
@@ -60,30 +89,12 @@ class ApplyArmatureScale(bpy.types.Operator):
 
 			# Adjust constraints
 			for c in b.constraints:
-				if c.type in ['LIMIT_LOCATION', 'LIMIT_SCALE']:
-					props = ['min_x', 'max_x',
-							'min_y', 'max_y',
-							'min_z', 'max_z',
-					]
-				elif c.type=='LIMIT_DISTANCE':
-					props = ['distance']
-				elif c.type=='TRANSFORM':
-					props = [
-						"from_min_x", "from_max_x", "to_min_x", "to_max_x",
-						"from_min_y", "from_max_y", "to_min_y", "to_max_y",
-						"from_min_z", "from_min_z", "to_min_z", "to_max_z"
-					]
-				elif c.type=='STRETCH_TO':
-					props = ["rest_length"]
-				elif c.type=='ACTION':
-					if c.action not in actions:
-						actions.append(c.action)
-					props = ["min", "max"]
-				elif c.type=='FLOOR':
-					props = ["offset"]
-				else:
+				props = LOCATION_PROPS.get(c.type)
+				if not props:
 					continue
-				
+				if c.type=='ACTION' and c.action not in actions:
+					actions.append(c.action)
+
 				for prop in props:
 					new_value = getattr(c, prop) * scale
 					setattr(c, prop, new_value)
@@ -95,15 +106,13 @@ class ApplyArmatureScale(bpy.types.Operator):
 			for action in actions:
 				for cur in action.fcurves:
 					if "location" in cur.data_path:
-						for kf in cur.keyframe_points:
-							kf.co[1] *= scale
-							kf.handle_left[1] *= scale
-							kf.handle_right[1] *= scale
+						scale_fcurve_values(cur, scale)
 
 
 		bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
 
-		bpy.ops.object.mode_set(mode=org_mode)
+		if org_mode != 'OBJECT':
+			bpy.ops.object.mode_set(mode=org_mode)
 		
 		return {'FINISHED'}
 
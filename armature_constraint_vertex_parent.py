@@ -10,11 +10,13 @@ class MESH_OT_vertex_parent_bone(bpy.types.Operator):
 	@classmethod
 	def poll(cls, context):
 		"""This operator is available when there is a selected armature and the user is in mesh edit mode."""
-		if len(context.selected_objects) == 2:
-			if context.mode=='EDIT_MESH':
-				for o in context.selected_objects:
-					if o.type=='ARMATURE':
-						return True
+		# Cheapest checks first, since poll() runs on every redraw.
+		if context.mode != 'EDIT_MESH':
+			return False
+		selected_objects = context.selected_objects
+		if len(selected_objects) != 2:
+			return False
+		return any(o.type=='ARMATURE' for o in selected_objects)
 
 	def execute(self, context):
 		for o in context.selected_objects:
@@ -29,35 +31,48 @@ class MESH_OT_vertex_parent_bone(bpy.types.Operator):
 			if pb.bone.use_deform:
 				deforming_pose_bones.append(pb)
 
+		if not selected_pose_bones:
+			self.report({'ERROR'}, "No pose bones are selected.")
+			return {'CANCELLED'}
+
 		meshob = context.object
 		mesh = meshob.data
 
 		selected_verts = list(filter(lambda v: v.select, mesh.vertices))
 
+		# Index the deforming bones' vertex groups once, so each vertex only
+		# has to walk its own group assignments, instead of querying every group.
+		deform_groups = {}	# vertex group index : pose bone name
+		for pb in deforming_pose_bones:
+			vg = meshob.vertex_groups.get(pb.name)
+			if not vg: continue
+			deform_groups[vg.index] = vg.name
+
 		weights = {}	# pose bone name : total un-normalized weight
 		for v in selected_verts:
-			for pb in deforming_pose_bones:
-				vg = meshob.vertex_groups.get(pb.name)
-				if not vg: continue
+			for g in v.groups:
+				bonename = deform_groups.get(g.group)
+				if bonename is None: continue
 
-				try:
-					w = vg.weight(v.index)
-					if vg.name not in weights:
-						weights[vg.name] = 0
-					weights[vg.name] += w
-				except:
-					pass
+				if bonename not in weights:
+					weights[bonename] = 0
+				weights[bonename] += g.weight
 
 		# Normalize the weights
 		sum_weights = sum(weights.values())
+		if not sum_weights:
+			self.report({'ERROR'}, "Selected vertices are not weighted to any deforming bones.")
+			return {'CANCELLED'}
 		weights = {bonename:v/sum_weights for (bonename, v) in weights.items()}
+		targets = list(weights.items())
 		for pb in selected_pose_bones:
 			arm_con = pb.constraints.new('ARMATURE')
-			for bonename in weights.keys():
-				t = arm_con.targets.new()
+			new_target = arm_con.targets.new
+			for bonename, weight in targets:
+				t = new_target()
 				t.target = rig
 				t.subtarget = bonename
-				t.weight = weights[bonename]
+				t.weight = weight
 
 		return {'FINISHED'}
 
@@ -2,13 +2,18 @@
 def clear_filtered_drivers(context, filtr: str) -> None:
     """Copy all drivers from one object to another."""
 
+    if not filtr:
+        return
+
     for obj in context.selected_objects:
         if not hasattr(obj, "animation_data") or not obj.animation_data:
             continue
 
-        for fc in obj.animation_data.drivers[:]:
-            if filtr and filtr in fc.data_path:
-                obj.animation_data.drivers.remove(fc)
+        # Only collect the matching drivers, rather than copying the whole list.
+        drivers = obj.animation_data.drivers
+        to_remove = [fc for fc in drivers if filtr in fc.data_path]
+        for fc in to_remove:
+            drivers.remove(fc)
 
 kwargs = locals().get("kwargs", {})
 filtr = kwargs.get("filter", '')
@@ -64,15 +64,24 @@ def copy_filtered_drivers_to_selected_obs(context, filtr: str) -> None:
     """Copy all drivers from one object to another."""
 
     source_ob = context.object
+    if not filtr:
+        return
+    if not hasattr(source_ob, "animation_data") or not source_ob.animation_data:
+        return
+
+    # Filter the source drivers once, rather than once per target object.
+    source_fcurves = [
+        fc for fc in source_ob.animation_data.drivers if filtr in fc.data_path
+    ]
+    if not source_fcurves:
+        return
+
     for target_ob in context.selected_objects:
         if target_ob == source_ob:
             continue
-        if not hasattr(source_ob, "animation_data") or not source_ob.animation_data:
-            return
 
-        for fc in source_ob.animation_data.drivers:
-            if filtr and filtr in fc.data_path:
-                copy_driver(fc, target_ob)
+        for fc in source_fcurves:
+            copy_driver(fc, target_ob)
 
 kwargs = locals().get("kwargs", {})
 filtr = kwargs.get("filter", '')
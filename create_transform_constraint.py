@@ -23,7 +23,7 @@ class POSE_OT_create_transform_constraint(Operator):
         active = context.active_pose_bone
         target = [pb for pb in context.selected_pose_bones if pb != active][0]
 
-        if any([pb.rotation_mode in {'QUATERNION', 'AXIS_ANGLE'} for pb in {active, target}]):
+        if any(pb.rotation_mode in {'QUATERNION', 'AXIS_ANGLE'} for pb in (active, target)):
             self.report({'ERROR'}, "Bones must have Euler rotation mode.")
             return {'CANCELLED'}
 
@@ -28,7 +28,7 @@ class OBJECT_OT_clear_parent(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context):
-        if not selected_objs_with_parents(context):
+        if not any(ob.parent for ob in context.selected_objects):
             cls.poll_message_set("No selected objects have parents.")
             return False
 
@@ -62,7 +62,7 @@ class OBJECT_OT_clear_parent_inverse_matrix(bpy.types.Operator):
 
         identity_matrix = Matrix.Identity(4)
         if not any(
-            [obj.matrix_parent_inverse != identity_matrix for obj in objs_with_parents]
+            obj.matrix_parent_inverse != identity_matrix for obj in objs_with_parents
         ):
             cls.poll_message_set("No selected objects have a parenting offset set.")
             return False
@@ -419,6 +419,7 @@ class OBJECT_OT_parent_set_advanced(bpy.types.Operator):
 
         bpy.ops.object.parent_set(type='OBJECT', keep_transform=keep_transform)
 
+        subtarget = active_bone.name
         objs_to_parent = [obj for obj in context.selected_objects if obj != rig]
         for obj in objs_to_parent:
             arm_con = None
@@ -428,11 +429,11 @@ class OBJECT_OT_parent_set_advanced(bpy.types.Operator):
                     arm_con = con
                     break
             if not arm_con:
-                arm_con = obj.new(type='ARMATURE')
+                arm_con = obj.constraints.new(type='ARMATURE')
 
-                target = arm_con.targets.new()
-                target.target = rig
-                target.subtarget = active_bone.name
+            target = arm_con.targets.new()
+            target.target = rig
+            target.subtarget = subtarget
 
         # Draw a nice info message.
         objs_str = (
@@ -446,6 +447,13 @@ class OBJECT_OT_parent_set_advanced(bpy.types.Operator):
         parent_ob = context.active_object
         objs_to_parent = [obj for obj in context.selected_objects if obj != parent_ob]
 
+        # The inverse matrix is the same for every child, so only calculate it once.
+        active_pb = context.active_pose_bone
+        if active_pb:
+            inverse_matrix = (parent_ob.matrix_world @ active_pb.matrix).inverted()
+        else:
+            inverse_matrix = parent_ob.matrix_world.inverted()
+
         for obj in objs_to_parent:
             if obj.parent:
                 self.report(
@@ -461,23 +469,15 @@ class OBJECT_OT_parent_set_advanced(bpy.types.Operator):
 
             childof = obj.constraints.new(type='CHILD_OF')
             childof.target = parent_ob
-            if context.active_pose_bone:
-                childof.subtarget = context.active_pose_bone.name
-                childof.inverse_matrix = (
-                    parent_ob.matrix_world @ context.active_pose_bone.matrix
-                ).inverted()
-            else:
-                childof.inverse_matrix = parent_ob.matrix_world.inverted()
+            if active_pb:
+                childof.subtarget = active_pb.name
+            childof.inverse_matrix = inverse_matrix
 
         # Draw a nice info message.
         objs_str = (
             obj.name if len(objs_to_parent) == 1 else f"{len(objs_to_parent)} objects"
         )
-        parent_str = (
-            context.active_pose_bone.name
-            if context.active_pose_bone
-            else parent_ob.name
-        )
+        parent_str = active_pb.name if active_pb else parent_ob.name
         self.report({'INFO'}, f"Constrained {objs_str} to {parent_str}")
         return {'FINISHED'}
 
@@ -485,22 +485,19 @@ class OBJECT_OT_parent_set_advanced(bpy.types.Operator):
         """Parent selected bones to the active object/bone using Copy Transforms constraints."""
         parent_ob = context.active_object
         objs_to_parent = [obj for obj in context.selected_objects if obj != parent_ob]
+        active_pb = context.active_pose_bone
 
         for obj in objs_to_parent:
             copytrans = obj.constraints.new(type='COPY_TRANSFORMS')
             copytrans.target = parent_ob
-            if context.active_pose_bone:
-                copytrans.subtarget = context.active_pose_bone.name
+            if active_pb:
+                copytrans.subtarget = active_pb.name
 
         # Draw a nice info message.
         objs_str = (
             obj.name if len(objs_to_parent) == 1 else f"{len(objs_to_parent)} objects"
         )
-        parent_str = (
-            context.active_pose_bone.name
-            if context.active_pose_bone
-            else parent_ob.name
-        )
+        parent_str = active_pb.name if active_pb else parent_ob.name
         self.report({'INFO'}, f"Constrained {objs_str} to {parent_str}")
         return {'FINISHED'}
 
@@ -94,9 +94,7 @@ class OBJECT_OT_select_symmetry_object(Operator, ObjectSelectOperatorMixin):
         flipped_objs = [context.scene.objects.get(flip_name(ob.name)) for ob in objs]
         flipped_active = context.scene.objects.get(flip_name(active_obj.name))
 
-        notflipped = len(
-            [objs[i] for i in range(len(objs)) if objs[i] == flipped_objs[i]]
-        )
+        notflipped = sum(1 for ob, fl in zip(objs, flipped_objs) if ob == fl)
         if notflipped > 0:
             self.report({'WARNING'}, f"{notflipped} objects had no opposite.")
 
@@ -1,4 +1,4 @@
-import bpy
+import bpy, re
 from . import utils
 from bpy.props import (
     EnumProperty,
@@ -8,6 +8,9 @@ from bpy.props import (
     StringProperty,
 )
 
+# Extracts the bone name from an F-Curve data path like `pose.bones["Bone"].location`.
+POSE_BONE_PATH_RE = re.compile(r'^pose\.bones\["([^"]+)"\]')
+
 
 class SetupActionConstraints(bpy.types.Operator):
     """Automatically manage action constraints of one action on all bones in an armature."""
@@ -137,47 +140,54 @@ class SetupActionConstraints(bpy.types.Operator):
         armature = context.object
         action = armature.animation_data.action
         assert action, "No action was selected."
-        constraint_name = "Action_" + action.name.replace("Rain_", "")
-        constraint_name_left = (
-            "Action_" + action.name.replace("Rain_", "") + ".L"
-        )  # TODO: Hard coded action naming convention.
-        constraint_name_right = "Action_" + action.name.replace("Rain_", "") + ".R"
+        # TODO: Hard coded action naming convention.
+        constraint_name = "Action_" + action.name.removeprefix("Rain_")
+        constraint_name_left = constraint_name + ".L"
+        constraint_name_right = constraint_name + ".R"
         constraint_names = [
             constraint_name,
             constraint_name_left,
             constraint_name_right,
         ]
 
+        pose_bones = armature.pose.bones
         affect_bones = []
         if self.affect == 'ALL':
-            affect_bones = [b.name for b in armature.pose.bones]
+            affect_bones = [b.name for b in pose_bones]
         else:
             affect_bones = [b.name for b in context.selected_pose_bones]
+        # Set for the per-fcurve membership test below.
+        affect_bone_set = set(affect_bones)
 
         # Getting a list of pose bones on the active armature corresponding to the selected action's keyframes
         bones = []
+        # Names of the above bones, for O(1) de-duplication and membership tests.
+        bone_names = set()
         for fc in action.fcurves:
             # Extracting bone name from fcurve data path
-            if "pose.bones" in fc.data_path:
-                bone_name = fc.data_path.split('["')[1].split('"]')[0]
+            match = POSE_BONE_PATH_RE.match(fc.data_path)
+            if match:
+                bone_name = match.group(1)
 
-                if bone_name not in affect_bones:
+                if bone_name not in affect_bone_set:
                     continue
 
-                bone = armature.pose.bones.get(bone_name)
-                if bone and bone not in bones:
+                bone = pose_bones.get(bone_name)
+                if bone and bone_name not in bone_names:
+                    bone_names.add(bone_name)
                     bones.append(bone)
 
+        # Only computed once, since the loop below only ever swaps the subtarget's
+        # .L/.R suffix, which doesn't change whether it is flippable.
+        subtarget_flippable = bpy.utils.flip_name(self.subtarget) != self.subtarget
+
         # Adding or updating Action constraint on the bones
         for b in bones:
             constraints = [c for c in b.constraints if c.name in constraint_names]
 
             # Creating Action constraints
             if len(constraints) == 0:
-                if (
-                    bpy.utils.flip_name(b.name) == b.name
-                    and bpy.utils.flip_name(self.subtarget) != self.subtarget
-                ):
+                if bpy.utils.flip_name(b.name) == b.name and subtarget_flippable:
                     # If bone name is unflippable, but target bone name is flippable, split constraint in two.
                     c_l = utils.find_or_create_constraint(
                         b, 'ACTION', constraint_name_left
@@ -200,10 +210,10 @@ class SetupActionConstraints(bpy.types.Operator):
 
                 # If bone name indicates a side, force subtarget to that side, if subtarget is flippable.
                 if b.name.endswith(".L") and self.subtarget.endswith(".R"):
-                    if bpy.utils.flip_name(self.subtarget) != self.subtarget:
+                    if subtarget_flippable:
                         self.subtarget = self.subtarget[:-2] + ".L"
                 if b.name.endswith(".R") and self.subtarget.endswith(".L"):
-                    if bpy.utils.flip_name(self.subtarget) != self.subtarget:
+                    if subtarget_flippable:
                         self.subtarget = self.subtarget[:-2] + ".R"
 
                 # If constraint name indicates a side, force subtarget to that side and set influence to 0.5.
@@ -228,7 +238,7 @@ class SetupActionConstraints(bpy.types.Operator):
 
         # Deleting superfluous action constraints, if any
         for bn in affect_bones:
-            b = armature.pose.bones.get(bn)
+            b = pose_bones.get(bn)
             for c in b.constraints:
                 if c.type == 'ACTION':
                     # If the constraint targets this action
@@ -246,7 +256,7 @@ class SetupActionConstraints(bpy.types.Operator):
                             b.constraints.remove(c)
                             continue
                         # If the name is fine, but there is no associated keyframe
-                        elif b not in bones:
+                        elif b.name not in bone_names:
                             b.constraints.remove(c)
                             continue
                     # Any action constraint with no action
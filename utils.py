@@ -78,31 +78,27 @@ def bone_search(armature, search=None, start=None, end=None, edit_bone=False, mu
 		bone_list = armature.data.edit_bones
 	else:
 		bone_list = armature.pose.bones
-	
+
+	assert search or start or end, "Nothing passed."
+
+	def name_matches(name):
+		if search:
+			return search in name
+		if start:
+			return name.startswith(start)
+		return name.endswith(end)
+
+	# Single pass over the bones, whichever criterion was passed.
 	matching_bones = []
-	if search:
-		for b in bone_list:
-			if search in b.name:
-				if must_be_selected:
-					if edit_bone:
-						if b.select:
-							matching_bones.append(b)
-					else:
-						if b.bone.select:
-							matching_bones.append(b)
-				else:
-					matching_bones.append(b)
-	elif start:
-		for b in matching_bones:
-			if not b.name.startswith(start):
-				matching_bones.remove(b)
-	elif end:
-		for b in matching_bones:
-			if not b.name.endswith(end):
-				matching_bones.remove(b)
-	else:
-		assert False, "Nothing passed."
-	
+	for b in bone_list:
+		if not name_matches(b.name):
+			continue
+		if must_be_selected:
+			is_selected = b.select if edit_bone else b.bone.select
+			if not is_selected:
+				continue
+		matching_bones.append(b)
+
 	return matching_bones
 
 def find_nearby_edit_bones(armature, search_co, dist=0.0005, search_bones=None) -> List[bpy.types.EditBone]:
@@ -48,22 +48,30 @@ class AddVertexWeightsToActiveOperator(bpy.types.Operator):
         vertex_groups = obj.vertex_groups
         active_vertex_group = vertex_groups.get(active_bone_name)
 
+        # Collect the weights of all groups to merge in a single pass over the
+        # vertices, before any group is removed and the indices shift.
+        weights_by_group = {}  # vertex group index : {vertex index : weight}
         for bone in pose_bones:
             vertex_group = vertex_groups.get(bone.name)
-            if not vertex_group:
-                continue
-
-            weights_to_add = {}
-            for vertex in obj.data.vertices:
-                for group in vertex.groups:
-                    if group.group == vertex_group.index:
-                        if vertex.index not in weights_to_add:
-                            weights_to_add[vertex.index] = 0.0
-                        weights_to_add[vertex.index] += group.weight
-
+            if vertex_group:
+                weights_by_group[vertex_group.index] = {}
+
+        for vertex in obj.data.vertices:
+            for group in vertex.groups:
+                weights_to_add = weights_by_group.get(group.group)
+                if weights_to_add is None:
+                    continue
+                if vertex.index not in weights_to_add:
+                    weights_to_add[vertex.index] = 0.0
+                weights_to_add[vertex.index] += group.weight
+
+        groups_to_remove = [vertex_groups[index] for index in weights_by_group]
+        for vertex_group in groups_to_remove:
+            weights_to_add = weights_by_group[vertex_group.index]
             for vertex_index, weight in weights_to_add.items():
                 active_vertex_group.add([vertex_index], weight, 'ADD')
 
+        for vertex_group in groups_to_remove:
             vertex_groups.remove(vertex_group)
 
         self.report(